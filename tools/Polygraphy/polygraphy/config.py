@@ -57,3 +57,10 @@ A negative value disables swapping and a value of 0 causes all arrays to be save
 Disabled by default.
 This can be configured by setting the 'POLYGRAPHY_ARRAY_SWAP_THRESHOLD_MB' environment variable.
 """
+
+JSON_COMPRESS = bool(os.environ.get("POLYGRAPHY_JSON_COMPRESS", "0") != "0")
+"""
+bool: Whether Polygraphy will compress array and tensor data with zlib before encoding it to JSON.
+This can make JSON files containing highly compressible data (e.g. zero-initialized arrays) much smaller.
+This can be configured by setting the 'POLYGRAPHY_JSON_COMPRESS' environment variable.
+"""
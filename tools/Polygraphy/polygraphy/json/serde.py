@@ -16,16 +16,69 @@
 #
 
 import base64
+import contextlib
 import functools
 import io
 import json
-from collections import OrderedDict
+import math
+import os
+import struct
+import threading
+import zlib
 
-from polygraphy import constants, mod, util
+from polygraphy import config, constants, mod, util
 from polygraphy.logger import G_LOGGER
 
 np = mod.lazy_import("numpy")
 torch = mod.lazy_import("torch>=1.13.0")
+pybase64 = mod.lazy_import("pybase64")
+orjson = mod.lazy_import("orjson")
+
+
+# Caches whether optional modules are available. See `is_available`.
+AVAILABLE_MODULES = {}
+
+
+def is_available(module):
+    # Checking whether a module is installed requires probing the file system, which is expensive relative
+    # to encoding small objects, so we only check once. The modules checked here are optional and are never
+    # installed automatically, so a missing module will not become available later.
+    available = AVAILABLE_MODULES.get(module)
+    if available is None:
+        available = module.is_installed() and module.is_importable()
+        AVAILABLE_MODULES[module] = available
+    return available
+
+
+def b64encode(data):
+    # pybase64 is a SIMD-accelerated drop-in replacement for the standard library base64 module,
+    # which makes a significant difference for large arrays.
+    if is_available(pybase64):
+        return pybase64.b64encode(data).decode("ascii")
+    return base64.b64encode(data).decode()
+
+
+def b64decode(data):
+    if is_available(pybase64):
+        return pybase64.b64decode_as_bytearray(data, validate=True)
+    return base64.b64decode(data.encode(), validate=True)
+
+
+def encode_buffer(key, data):
+    # Base64-encodes the buffer under the specified key, compressing it first if requested.
+    if config.JSON_COMPRESS:
+        return {key: b64encode(zlib.compress(data, 1)), "codec": "zlib"}
+    return {key: b64encode(data)}
+
+
+def decode_buffer(dct, key):
+    data = b64decode(dct[key])
+    if dct.get("codec") == "zlib":
+        data = zlib.decompress(data)
+    # Arrays and tensors created from the buffer are only writable if the buffer itself is.
+    if not isinstance(data, bytearray):
+        data = bytearray(data)
+    return data
 
 
 def legacy_str_from_type(typ):
@@ -123,6 +176,7 @@ class BaseCustomImpl:
                     return dct
 
                 add(typ, wrapped)
+                cls._resolve.cache_clear()
                 return wrapped
             elif cls == Decoder:
 
@@ -137,6 +191,7 @@ class BaseCustomImpl:
                     return func(dct)
 
                 add(legacy_str_from_type(typ), wrapped)
+                cls.polygraphy_legacy_keys.add(legacy_str_from_type(typ))
                 add(str_from_type(typ), wrapped)
                 if alias is not None:
                     add(alias, wrapped)
@@ -154,9 +209,21 @@ class Encoder(BaseCustomImpl, json.JSONEncoder):
 
     polygraphy_registered = {}
 
+    @classmethod
+    @functools.lru_cache(maxsize=None)
+    def _resolve(cls, typ):
+        # Returns the encoder function registered for the closest base class of the type, if any.
+        # The cache is cleared whenever a new encoder is registered.
+        for base in typ.__mro__:
+            encode = cls.polygraphy_registered.get(base)
+            if encode is not None:
+                return encode
+        return None
+
     def default(self, o):
-        if type(o) in self.polygraphy_registered:
-            return self.polygraphy_registered[type(o)](o)
+        encode = self._resolve(type(o))
+        if encode is not None:
+            return encode(o)
         return super().default(o)
 
 
@@ -167,20 +234,12 @@ class Decoder(BaseCustomImpl):
     """
 
     polygraphy_registered = {}
+    polygraphy_legacy_keys = set()
 
-    def __call__(self, pairs):
+    def __call__(self, dct):
         # The encoder will insert special key-value pairs into dictionaries encoded from
         # custom types. If we find one, then we know to decode using the corresponding custom
         # type function.
-        dct = OrderedDict(pairs)
-
-        # Handle legacy naming first - these keys should not be present in JSON generated by more recent versions of Polygraphy.
-        for type_str, func in self.polygraphy_registered.items():
-            if (
-                type_str in dct and dct[type_str] == constants.LEGACY_TYPE_MARKER
-            ):  # Found a custom type!
-                return func(dct)
-
         type_name = dct.get(constants.TYPE_MARKER)
         if type_name is not None:
             if type_name not in self.polygraphy_registered:
@@ -193,12 +252,274 @@ class Decoder(BaseCustomImpl):
                 )
             return self.polygraphy_registered[type_name](dct)
 
+        # Handle legacy naming - these keys should not be present in JSON generated by more recent versions of Polygraphy.
+        for type_str in self.polygraphy_legacy_keys.intersection(dct):
+            if dct[type_str] == constants.LEGACY_TYPE_MARKER:  # Found a custom type!
+                return self.polygraphy_registered[type_str](dct)
+
         return dct
 
 
+# The decoder holds no per-call state, so a single instance can be shared.
+_DECODER = Decoder()
+
+
+class _UnsupportedByOrjson(Exception):
+    """
+    Raised when orjson would encode an object differently from the standard library.
+    """
+
+    pass
+
+
+# orjson does not support objects nested more deeply than this.
+ORJSON_MAX_DEPTH = 255
+
+
+def _preencode(obj):
+    # orjson cannot call back into our encoder for custom types in the same way as `json.JSONEncoder.default`,
+    # so we convert any registered types into plain Python containers up front.
+    #
+    # This is implemented iteratively since it is on the hot path for large objects like `RunResults`.
+    # Each frame on the stack is a value to convert along with where to store the result.
+    # Builtins and methods are bound to locals to avoid repeated global and attribute lookups.
+    resolve = Encoder._resolve
+    isfinite = math.isfinite
+    _isinstance, _type, _dict, _list, _tuple = isinstance, type, dict, list, tuple
+    _str, _int, _float, _set, _all, _map = str, int, float, set, all, map
+    # Values of these exact types can be passed to orjson as-is, which lets us skip the slower checks below.
+    scalar_types = {str, int, bool, type(None)}
+    float_types = {float}
+
+    root = [None]
+    stack = [(root, 0, obj, 0)]
+    pop = stack.pop
+    push = stack.append
+    while stack:
+        container, key, val, depth = pop()
+
+        typ = _type(val)
+        if typ in scalar_types:
+            container[key] = val
+            continue
+
+        encode = resolve(typ)
+        if encode is not None:
+            # The encoded value may itself contain registered types.
+            push((container, key, encode(val), depth))
+            continue
+
+        if _isinstance(val, _dict):
+            # This also guards against circular references, which the standard library will report.
+            if depth >= ORJSON_MAX_DEPTH:
+                raise _UnsupportedByOrjson()
+            # Populate the keys up front so that their order is preserved.
+            new_val = _dict.fromkeys(val)
+            for child_key, child in val.items():
+                # orjson can convert more types of keys to strings than the standard library.
+                if _type(child_key) is not _str and not (
+                    _isinstance(child_key, (_str, _int)) or child_key is None
+                ):
+                    raise _UnsupportedByOrjson()
+                child_type = _type(child)
+                if child_type in scalar_types or (
+                    child_type is _float and isfinite(child)
+                ):
+                    new_val[child_key] = child
+                else:
+                    push((new_val, child_key, child, depth + 1))
+            val = new_val
+        elif _isinstance(val, (_list, _tuple)):
+            if depth >= ORJSON_MAX_DEPTH:
+                raise _UnsupportedByOrjson()
+            # Lists made up only of scalars, like shapes, are common and can be passed through without
+            # visiting each element. orjson does not modify its input, so we do not need to copy them.
+            child_types = _set(_map(_type, val))
+            if child_types <= scalar_types or (
+                child_types == float_types and _all(_map(isfinite, val))
+            ):
+                container[key] = val
+                continue
+            new_val = _list(val)
+            for index, child in enumerate(val):
+                child_type = _type(child)
+                if not (
+                    child_type in scalar_types
+                    or (child_type is _float and isfinite(child))
+                ):
+                    push((new_val, index, child, depth + 1))
+            val = new_val
+        elif _isinstance(val, _float):
+            # orjson writes non-finite values as `null` whereas the standard library writes `NaN`/`Infinity`.
+            if not isfinite(val):
+                raise _UnsupportedByOrjson()
+            val = _float(val)
+        elif not (_isinstance(val, (_str, _int)) or val is None):
+            # orjson natively serializes some types that the standard library does not, like `datetime`
+            # and dataclasses. Let the standard library handle these so that behavior does not depend
+            # on whether orjson is installed.
+            raise _UnsupportedByOrjson()
+
+        container[key] = val
+    return root[0]
+
+
+def _orjson_dumps(obj):
+    # Encodes the object with indentation. Returns `None` if orjson is not available or cannot handle
+    # the object, in which case the standard library should be used instead.
+    #
+    # For compact output, the standard library's C encoder is faster than pre-encoding the object for orjson,
+    # so orjson is only worth using when indenting, which the standard library implements in pure Python.
+    if not is_available(orjson):
+        return None
+    option = orjson.OPT_NON_STR_KEYS | orjson.OPT_INDENT_2
+
+    # Encoders may add buffers to the side binary file while pre-encoding. Since the standard
+    # library will encode the object again if we fall back, those buffers must be discarded.
+    writer = getattr(SIDE_BINARY_STATE, "writer", None)
+    checkpoint = writer.checkpoint() if writer is not None else None
+    try:
+        data = orjson.dumps(_preencode(obj), option=option)
+        # orjson writes non-ASCII characters as UTF-8 whereas the standard library escapes them.
+        # Escaped output can be safely written to text files regardless of the locale's encoding.
+        if not data.isascii():
+            raise _UnsupportedByOrjson()
+        return data
+    except (_UnsupportedByOrjson, orjson.JSONEncodeError):
+        # orjson cannot encode some objects that the standard library can, e.g. large integers.
+        if writer is not None:
+            writer.restore(checkpoint)
+        return None
+
+
+def _stdlib_dumps(obj, compact):
+    if compact:
+        # Avoiding indentation also lets the standard library use its faster C encoder.
+        return json.dumps(obj, cls=Encoder, separators=(",", ":"))
+    return json.dumps(obj, cls=Encoder, indent=constants.TAB)
+
+
+# Arrays smaller than this are stored as plain JSON lists, which are both smaller and faster
+# to decode than base64-encoded NPY data at this size.
+SMALL_ARRAY_THRESHOLD_BYTES = 256
+
+# The header of the compact array encoding is padded to a multiple of this so that decoded arrays are aligned,
+# like in the NPY format.
+COMPACT_ARRAY_HEADER_ALIGNMENT = 64
+
+
+def compact_array_header_size(ndim):
+    size = struct.calcsize(f"<BB{ndim}Q")
+    return size + (-size % COMPACT_ARRAY_HEADER_ALIGNMENT)
+
+
+# Arrays and tensors at least this large are written to the side binary file, if one is being used. See `save_json`.
+SIDE_BINARY_THRESHOLD_BYTES = 1 << 16
+# Alignment of each buffer in a side binary file.
+SIDE_BINARY_ALIGNMENT = 64
+
+# Holds the `SideBinaryWriter` used while saving and the directory containing side binary files while loading.
+SIDE_BINARY_STATE = threading.local()
+
+
+@contextlib.contextmanager
+def side_binary_state(attr, value):
+    prev = getattr(SIDE_BINARY_STATE, attr, None)
+    setattr(SIDE_BINARY_STATE, attr, value)
+    try:
+        yield
+    finally:
+        setattr(SIDE_BINARY_STATE, attr, prev)
+
+
+class SideBinaryWriter:
+    """
+    Accumulates buffers to write to a side binary file alongside a JSON file.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.buffers = []
+        self.nbytes = 0
+
+    def add(self, data):
+        padding = -self.nbytes % SIDE_BINARY_ALIGNMENT
+        if padding:
+            self.buffers.append(bytes(padding))
+        offset = self.nbytes + padding
+        self.buffers.append(data)
+        self.nbytes = offset + data.nbytes
+        return {
+            "ext": os.path.basename(self.path),
+            "offset": offset,
+            "nbytes": data.nbytes,
+        }
+
+    def checkpoint(self):
+        return len(self.buffers), self.nbytes
+
+    def restore(self, checkpoint):
+        num_buffers, self.nbytes = checkpoint
+        del self.buffers[num_buffers:]
+
+    def save(self):
+        util.makedirs(self.path)
+        with open(self.path, "wb") as f:
+            for buf in self.buffers:
+                f.write(buf)
+
+
+def add_to_side_binary(data):
+    # Returns a reference to the data in the side binary file, or `None` if the data should be stored inline.
+    writer = getattr(SIDE_BINARY_STATE, "writer", None)
+    if writer is None or data.nbytes < SIDE_BINARY_THRESHOLD_BYTES:
+        return None
+    return writer.add(data)
+
+
+def get_side_binary_path(dct):
+    ext = dct["ext"]
+    # Side binary files are always written next to the JSON file, so anything other than
+    # a plain file name could be used to read arbitrary files.
+    if (
+        not isinstance(ext, str)
+        or ext in ["", ".", ".."]
+        or os.path.basename(ext) != ext
+        or "/" in ext
+        or "\\" in ext
+    ):
+        G_LOGGER.critical(
+            f"Invalid side binary file name: {ext}. Side binary files must be located in the same directory as the JSON file."
+        )
+
+    directory = getattr(SIDE_BINARY_STATE, "directory", None)
+    if directory is None:
+        G_LOGGER.critical(
+            f"Could not locate side binary file: {ext}. JSON which refers to a side binary file must be loaded with `load_json()`."
+        )
+    return os.path.join(directory, ext)
+
+
+def read_side_binary(dct):
+    # We read the data into memory rather than memory-mapping the file so that the file
+    # can safely be overwritten, e.g. by saving the decoded object to the same path.
+    data = bytearray(dct["nbytes"])
+    path = get_side_binary_path(dct)
+    with open(path, "rb") as f:
+        f.seek(dct["offset"])
+        nbytes_read = f.readinto(data)
+    if nbytes_read != len(data):
+        G_LOGGER.critical(
+            f"Side binary file: {path} is truncated.\nNote: Expected {len(data)} bytes at offset {dct['offset']}, but only {nbytes_read} bytes could be read."
+        )
+    return data
+
+
 NUMPY_REGISTRATION_SUCCESS = False
 TORCH_REGISTRATION_SUCCESS = False
 COMMON_REGISTRATION_SUCCESS = False
+# Set once there is nothing left to register so that `try_register_common_json` can skip its checks.
+ALL_REGISTRATION_DONE = False
 
 
 def try_register_common_json(func):
@@ -212,23 +533,132 @@ def try_register_common_json(func):
 
     @functools.wraps(func)
     def wrapped(*args, **kwargs):
+        global ALL_REGISTRATION_DONE
+        if ALL_REGISTRATION_DONE:
+            return func(*args, **kwargs)
+
         global NUMPY_REGISTRATION_SUCCESS
         if not NUMPY_REGISTRATION_SUCCESS and np.is_installed() and np.is_importable():
             # We define this alongside load_json/save_json so that it is guaranteed to be
             # imported before we need to encode/decode NumPy arrays.
+
+            # Data types supported by the compact array encoding. The index of each data type is
+            # used as its code in the serialized data, so this list must only ever be appended to.
+            # Array data is always stored in little-endian byte order.
+            COMPACT_ARRAY_DTYPES = [
+                np.dtype(dtype).newbyteorder("<")
+                for dtype in [
+                    np.bool_,
+                    np.int8,
+                    np.uint8,
+                    np.int16,
+                    np.uint16,
+                    np.int32,
+                    np.uint32,
+                    np.int64,
+                    np.uint64,
+                    np.float16,
+                    np.float32,
+                    np.float64,
+                    np.complex64,
+                    np.complex128,
+                ]
+            ]
+            COMPACT_ARRAY_DTYPE_CODES = {
+                dtype: code for code, dtype in enumerate(COMPACT_ARRAY_DTYPES)
+            }
+
             @Encoder.register(np.ndarray)
             def encode(array):
+                # Subclasses are encoded with this function too, but many of them, like masked arrays, carry
+                # state which would be silently lost. Memory-mapped arrays are plain arrays backed by a file.
+                if type(array) is not np.ndarray and not isinstance(array, np.memmap):
+                    G_LOGGER.critical(
+                        f"Cannot encode instances of NumPy array subclass: {type(array).__name__} to JSON.\nNote: Use `np.asarray()` to convert it to a plain array first."
+                    )
+
+                # Larger types like `np.longdouble` are not converted to Python types by `tolist()`.
+                # Non-finite values are excluded since they are not valid JSON and would prevent the use of orjson.
+                if (
+                    array.nbytes < SMALL_ARRAY_THRESHOLD_BYTES
+                    and array.dtype.itemsize <= 8
+                    and (
+                        array.dtype.kind in "biu"
+                        or (array.dtype.kind == "f" and np.isfinite(array).all())
+                    )
+                ):
+                    return {
+                        "array_lite": array.tolist(),
+                        "dtype": str(array.dtype),
+                        "shape": list(array.shape),
+                    }
+
+                if array.dtype.hasobject:
+                    G_LOGGER.critical(
+                        f"Cannot encode arrays containing Python objects to JSON.\nNote: Array has data type: {array.dtype}"
+                    )
+
+                if not array.flags.c_contiguous:
+                    array = array.copy(order="C")
+
+                code = COMPACT_ARRAY_DTYPE_CODES.get(array.dtype)
+                if code is not None:
+                    ref = add_to_side_binary(array.reshape(-1).view(np.uint8))
+                    if ref is not None:
+                        return {
+                            "dtype": array.dtype.str,
+                            "shape": list(array.shape),
+                            **ref,
+                        }
+
+                    # For common data types, we use a compact header consisting of the data type code,
+                    # the number of dimensions, and the shape, which is much cheaper to write and parse
+                    # than an NPY header.
+                    header = bytearray(compact_array_header_size(array.ndim))
+                    struct.pack_into(
+                        f"<BB{array.ndim}Q", header, 0, code, array.ndim, *array.shape
+                    )
+                    outfile = io.BytesIO()
+                    outfile.write(header)
+                    outfile.write(array.reshape(-1).view(np.uint8))
+                    # `getbuffer()` gives us a view of the contents without making another copy.
+                    return {"v": 2, **encode_buffer("b", outfile.getbuffer())}
+
+                # Otherwise, write an NPY header ourselves so that we can stream the array data directly into
+                # the buffer instead of going through `np.save`.
                 outfile = io.BytesIO()
-                np.save(outfile, array, allow_pickle=False)
-                outfile.seek(0)
-                data = base64.b64encode(outfile.read()).decode()
-                return {"array": data}
+                np.lib.format.write_array_header_1_0(
+                    outfile, np.lib.format.header_data_from_array_1_0(array)
+                )
+                outfile.write(array.reshape(-1).view(np.uint8))
+                return encode_buffer("array", outfile.getbuffer())
 
             @Decoder.register(np.ndarray)
             def decode(dct):
+                if "array_lite" in dct:
+                    return np.asarray(dct["array_lite"], dtype=dct["dtype"]).reshape(
+                        dct["shape"]
+                    )
+
+                if "ext" in dct:
+                    return np.frombuffer(
+                        read_side_binary(dct), dtype=dct["dtype"]
+                    ).reshape(dct["shape"])
+
+                if dct.get("v") == 2:
+                    data = decode_buffer(dct, "b")
+                    code, ndim = struct.unpack_from("<BB", data)
+                    shape = struct.unpack_from(f"<{ndim}Q", data, 2)
+                    return np.frombuffer(
+                        data,
+                        dtype=COMPACT_ARRAY_DTYPES[code],
+                        count=util.volume(shape),
+                        offset=compact_array_header_size(ndim),
+                    ).reshape(shape)
+
                 def load(mode="base64"):
                     if mode == "base64":
-                        data = base64.b64decode(dct["array"].encode(), validate=True)
+                        data = decode_buffer(dct, "array")
                     elif mode == "latin-1":
                         data = dct["array"].encode(mode)
                     else:
@@ -255,17 +685,55 @@ def try_register_common_json(func):
 
             @Encoder.register(torch.Tensor)
             def encode(tensor):
-                outfile = io.BytesIO()
-                torch.save(tensor, outfile)
-                outfile.seek(0)
-                data = base64.b64encode(outfile.read()).decode()
-                return {"tensor": data}
+                if (
+                    tensor.layout != torch.strided
+                    or tensor.is_quantized
+                    or not is_available(np)
+                ):
+                    # Sparse and quantized tensors are not backed by a single dense buffer, so we need
+                    # to fall back to `torch.save` for those.
+                    outfile = io.BytesIO()
+                    torch.save(tensor, outfile)
+                    return encode_buffer("tensor", outfile.getbuffer())
+
+                # For dense tensors, we can serialize the underlying buffer directly, which avoids
+                # the overhead of pickling.
+                # Conjugate and negative views are lazy, so we need to materialize them before reinterpreting the bytes.
+                cpu_tensor = (
+                    tensor.detach().cpu().resolve_conj().resolve_neg().contiguous()
+                )
+                data = cpu_tensor.reshape(-1).view(torch.uint8).numpy()
+                ref = add_to_side_binary(data)
+                return {
+                    "dtype": str(tensor.dtype),
+                    "shape": list(tensor.shape),
+                    "device": str(tensor.device),
+                    "requires_grad": tensor.requires_grad,
+                    **(ref if ref is not None else encode_buffer("data", data)),
+                }
 
             @Decoder.register(torch.Tensor)
             def decode(dct):
-                data = base64.b64decode(dct["tensor"].encode(), validate=True)
-                infile = io.BytesIO(data)
-                return torch.load(infile)
+                if "tensor" in dct:
+                    data = decode_buffer(dct, "tensor")
+                    infile = io.BytesIO(data)
+                    return torch.load(infile)
+
+                dtype = getattr(torch, dct["dtype"].split(".")[-1], None)
+                if not isinstance(dtype, torch.dtype):
+                    G_LOGGER.critical(
+                        f"Could not decode tensor with unrecognized data type: {dct['dtype']}"
+                    )
+                if "ext" in dct:
+                    data = read_side_binary(dct)
+                else:
+                    data = decode_buffer(dct, "data")
+                if not data:
+                    # `torch.frombuffer` does not accept empty buffers.
+                    tensor = torch.empty(dct["shape"], dtype=dtype)
+                else:
+                    tensor = torch.frombuffer(data, dtype=dtype).reshape(dct["shape"])
+                return tensor.to(dct["device"]).requires_grad_(dct["requires_grad"])
 
             TORCH_REGISTRATION_SUCCESS = True
 
@@ -279,6 +747,15 @@ def try_register_common_json(func):
             from polygraphy.comparator import RunResults
 
             COMMON_REGISTRATION_SUCCESS = True
+
+        # Modules which are not installed will never be registered unless they can be installed automatically later.
+        ALL_REGISTRATION_DONE = COMMON_REGISTRATION_SUCCESS and all(
+            success or (not config.AUTOINSTALL_DEPS and not module.is_installed())
+            for success, module in [
+                (NUMPY_REGISTRATION_SUCCESS, np),
+                (TORCH_REGISTRATION_SUCCESS, torch),
+            ]
+        )
         return func(*args, **kwargs)
 
     return wrapped
@@ -286,16 +763,57 @@ def try_register_common_json(func):
 
 @mod.export()
 @try_register_common_json
-def to_json(obj):
+def to_json(obj, compact=None):
     """
     Encode an object to JSON.
 
     NOTE: For Polygraphy objects, you should use the ``to_json()`` method instead.
 
+    If ``orjson`` is installed, it will be used to speed up encoding when ``compact`` is False.
+    Note that ``orjson`` only supports indenting with 2 spaces.
+
+    Args:
+        obj : The object to encode.
+        compact (bool):
+                Whether to omit indentation and whitespace from the output.
+                This is faster and produces smaller output, but is harder for humans to read.
+                Defaults to False.
+
     Returns:
         str: A JSON representation of the object.
     """
-    return json.dumps(obj, cls=Encoder, indent=constants.TAB)
+    compact = util.default(compact, False)
+    if not compact:
+        data = _orjson_dumps(obj)
+        if data is not None:
+            return data.decode()
+    return _stdlib_dumps(obj, compact)
+
+
+@mod.export()
+@try_register_common_json
+def to_json_bytes(obj, compact=None):
+    """
+    Encode an object to UTF-8 encoded JSON.
+
+    This is equivalent to ``to_json(obj, compact).encode()``, but avoids converting
+    between ``str`` and ``bytes`` when ``orjson`` is installed.
+
+    Args:
+        obj : The object to encode.
+        compact (bool):
+                Whether to omit indentation and whitespace from the output.
+                Defaults to False.
+
+    Returns:
+        bytes: A JSON representation of the object.
+    """
+    compact = util.default(compact, False)
+    if not compact:
+        data = _orjson_dumps(obj)
+        if data is not None:
+            return data
+    return _stdlib_dumps(obj, compact).encode()
 
 
 @mod.export()
@@ -307,18 +825,18 @@ def from_json(src):
     NOTE: For Polygraphy objects, you should use the ``from_json()`` method instead.
 
     Args:
-        src (str):
+        src (Union[str, bytes]):
                 The JSON representation of the object
 
     Returns:
         object: The decoded instance
     """
-    return json.loads(src, object_pairs_hook=Decoder())
+    return json.loads(src, object_hook=_DECODER)
 
 
 @mod.export()
 @try_register_common_json
-def save_json(obj, dest, description=None):
+def save_json(obj, dest, description=None, compact=None, side_binary=None):
     """
     Encode an object as JSON and save it to a file.
 
@@ -327,8 +845,41 @@ def save_json(obj, dest, description=None):
     Args:
         obj : The object to save.
         src (Union[str, file-like]): The path or file-like object to save to.
+        description (str): A description of what is being saved.
+        compact (bool):
+                Whether to omit indentation and whitespace from the output.
+                This is useful for files which are only meant to be read by tools.
+                Defaults to False.
+        side_binary (bool):
+                Whether to write the data of large arrays and tensors to a separate binary file
+                instead of base64-encoding it in the JSON. The binary file is written next to the JSON file
+                and has the same name with a ``.bin`` suffix; the two files must be kept together.
+                Such JSON must be loaded with ``load_json``.
+                Defaults to False.
     """
-    util.save_file(to_json(obj), dest, mode="w", description=description)
+    writer = None
+    if side_binary:
+        path = getattr(dest, "name", dest)
+        if not isinstance(path, str):
+            G_LOGGER.critical(
+                f"Cannot write a side binary file for: {dest} since it does not have a path."
+            )
+        writer = SideBinaryWriter(path + ".bin")
+
+    # File-like objects opened in text mode cannot accept bytes.
+    binary = "b" in getattr(dest, "mode", "b")
+    with side_binary_state("writer", writer):
+        if binary:
+            contents = to_json_bytes(obj, compact=compact)
+        else:
+            contents = to_json(obj, compact=compact)
+
+    # Only create the side binary file if something was actually written to it.
+    if writer is not None and writer.buffers:
+        writer.save()
+    util.save_file(
+        contents, dest, mode="wb" if binary else "w", description=description
+    )
 
 
 @mod.export()
@@ -345,7 +896,16 @@ def load_json(src, description=None):
     Returns:
         object: The object, or `None` if nothing could be read.
     """
-    return from_json(util.load_file(src, mode="r", description=description))
+    # Side binary files are located relative to the JSON file.
+    path = getattr(src, "name", src)
+    directory = (
+        os.path.dirname(os.path.abspath(path)) if isinstance(path, str) else None
+    )
+    # Reading bytes lets the JSON parser detect the encoding instead of relying on the locale's encoding.
+    # File-like objects opened in text mode can only be read as strings.
+    mode = "rb" if "b" in getattr(src, "mode", "b") else "r"
+    with side_binary_state("directory", directory):
+        return from_json(util.load_file(src, mode=mode, description=description))
 
 
 @mod.export()
@@ -405,7 +965,7 @@ def add_json_methods(description=None):
 
         # Save/Load methods
 
-        def _save_method(self, dest):
+        def _save_method(self, dest, compact=None):
             """
             Encode this instance as a JSON object and save it to the specified path
             or file-like object.
@@ -413,9 +973,13 @@ def add_json_methods(description=None):
             Args:
                 dest (Union[str, file-like]):
                       The path or file-like object to write to.
+                compact (bool):
+                      Whether to omit indentation and whitespace from the output.
+                      This makes saving faster and the file smaller, at the cost of readability.
+                      Defaults to False.
 
             """
-            save_json(self, dest, description=description)
+            save_json(self, dest, description=description, compact=compact)
 
         def _load_method(src):
             return check_decoded(load_json(src, description=description))
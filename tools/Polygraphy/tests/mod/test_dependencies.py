@@ -261,6 +261,8 @@ class TestAutoinstallDeps:
             "onnxmltools",
             "onnxruntime.tools.symbolic_shape_infer",
             "onnxruntime",
+            "orjson",
+            "pybase64",
             "tensorflow",
             "tensorrt",
             "tf2onnx",
@@ -15,16 +15,46 @@
 # limitations under the License.
 #
 
+import dataclasses
+import datetime
+import json
+import os
+import sys
+import tempfile
+
 import numpy as np
 import pytest
 import tensorrt as trt
 import torch
 
-from polygraphy import constants, util
+from polygraphy import config, constants, mod, util
 from polygraphy.backend.trt import Algorithm, TacticReplayData, TensorInfo
 from polygraphy.comparator import IterationResult, RunResults
 from polygraphy.exception import PolygraphyException
-from polygraphy.json import Decoder, Encoder, from_json, load_json, to_json
+from polygraphy.json import (
+    Decoder,
+    Encoder,
+    from_json,
+    load_json,
+    save_json,
+    to_json,
+    to_json_bytes,
+)
+from polygraphy.json import serde
+
+orjson = mod.lazy_import("orjson")
+
+
+@pytest.fixture(params=["orjson", "stdlib"])
+def json_backend(request, monkeypatch):
+    # Forces the JSON helpers to use the specified library for encoding so that the standard library
+    # path is tested even when orjson is installed.
+    if request.param == "orjson":
+        if not orjson.is_installed():
+            pytest.skip("orjson is not installed")
+    else:
+        monkeypatch.setitem(serde.AVAILABLE_MODULES, serde.orjson, False)
+    return request.param
 
 
 class Dummy:
@@ -43,6 +73,15 @@ def decode_dummy(dct):
     return Dummy(x=dct["x"])
 
 
+@dataclasses.dataclass
+class UnregisteredDataclass:
+    x: int
+
+
+class DummySubclass(Dummy):
+    pass
+
+
 class NoDecoder:
     def __init__(self, x):
         self.x = x
@@ -53,16 +92,106 @@ def encode_nodecoder(no_decoder):
     return {"x": no_decoder.x}
 
 
+@pytest.mark.usefixtures("json_backend")
 class TestEncoder:
-    def test_registered(self):
+    def test_registered(self, json_backend):
         d = Dummy(x=-1)
         d_json = to_json(d)
         assert encode_dummy(d) == {"x": d.x, constants.TYPE_MARKER: "Dummy"}
-        expected = f'{{\n    "x": {d.x},\n    "{constants.TYPE_MARKER}": "Dummy"\n}}'
+        # orjson only supports indenting with 2 spaces.
+        indent = "  " if json_backend == "orjson" else constants.TAB
+        expected = (
+            f'{{\n{indent}"x": {d.x},\n{indent}"{constants.TYPE_MARKER}": "Dummy"\n}}'
+        )
         assert d_json == expected
 
+    def test_registered_subclass(self):
+        d = DummySubclass(x=-1)
+        new_d = from_json(to_json(d))
+        assert type(new_d) == Dummy
+        assert new_d.x == d.x
+
+    def test_compact(self):
+        d = Dummy(x=-1)
+        assert (
+            to_json(d, compact=True)
+            == f'{{"x":{d.x},"{constants.TYPE_MARKER}":"Dummy"}}'
+        )
+        assert from_json(to_json(d, compact=True)).x == d.x
+
+    @pytest.mark.parametrize(
+        "obj, expected",
+        [
+            # orjson cannot handle these, so we should fall back to the standard library.
+            ({"inf": float("inf")}, {"inf": float("inf")}),
+            ({"nan": [float("-inf")]}, {"nan": [float("-inf")]}),
+            # orjson cannot handle integers outside the range of 64-bit integers.
+            (
+                {"large_int": [1 << 70, -(1 << 63) - 1]},
+                {"large_int": [1 << 70, -(1 << 63) - 1]},
+            ),
+            ({"uint64_max": (1 << 64) - 1}, {"uint64_max": (1 << 64) - 1}),
+            # Non-string keys should be converted to strings.
+            ({1: "one"}, {"1": "one"}),
+            # Non-ASCII characters should be escaped.
+            ({"n\u00e9v": "\u00e9"}, {"n\u00e9v": "\u00e9"}),
+        ],
+    )
+    def test_roundtrip_builtin_types(self, obj, expected):
+        encoded = to_json(obj)
+        assert encoded.isascii()
+        assert from_json(encoded) == expected
+
+    @staticmethod
+    def make_nested_list(depth):
+        obj = []
+        inner = obj
+        for _ in range(depth):
+            inner.append([])
+            inner = inner[0]
+        return obj
+
+    def test_deeply_nested(self):
+        # This is deeper than orjson supports, so the standard library should be used.
+        obj = self.make_nested_list(600)
+        assert from_json(to_json(obj)) == obj
+
+    def test_nested_deeper_than_recursion_limit(self):
+        # The behavior should match the standard library regardless of whether orjson is installed.
+        obj = self.make_nested_list(sys.getrecursionlimit() + 100)
+        with pytest.raises(RecursionError):
+            to_json(obj)
+
+    def test_circular_reference(self):
+        obj = {"list": []}
+        obj["list"].append(obj)
+        with pytest.raises(ValueError, match="Circular reference detected"):
+            to_json(obj)
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            datetime.datetime(2024, 1, 1),
+            UnregisteredDataclass(x=1),
+            {datetime.date(2024, 1, 1): 1},
+        ],
+    )
+    def test_unregistered_types_not_serializable(self, obj):
+        # The result should not depend on whether orjson, which natively supports some of these types, is installed.
+        with pytest.raises(TypeError):
+            to_json(obj)
+
 
 class TestDecoder:
+    def test_deeply_nested(self):
+        depth = 600
+        d_json = '{"x": ' * depth + "1" + "}" * depth
+
+        decoded = from_json(d_json)
+        for _ in range(depth):
+            decoded = decoded["x"]
+        assert decoded == 1
+
     def test_object_pairs_hook(self):
         d = Dummy(x=-1)
         d_json = to_json(d)
@@ -70,6 +199,13 @@ class TestDecoder:
         new_d = from_json(d_json)
         assert new_d.x == d.x
 
+    def test_legacy_type_marker(self):
+        d_json = f'{{"x": -1, "__polygraphy_encoded_Dummy": "{constants.LEGACY_TYPE_MARKER}"}}'
+
+        new_d = from_json(d_json)
+        assert isinstance(new_d, Dummy)
+        assert new_d.x == -1
+
     def test_error_on_no_decoder(self):
         d = NoDecoder(x=1)
         d_json = to_json(d)
@@ -166,9 +302,15 @@ class TestImplementations:
             ),
             np.ones((3, 4, 5), dtype=np.int64),
             np.ones(5, dtype=np.int64),
+            np.arange(4, dtype=np.float16).reshape(2, 2),
+            np.array(True),
+            np.arange(100, dtype=">i4"),
+            np.array([1 / 3], dtype=np.longdouble),
             np.zeros((4, 5), dtype=np.float32),
             np.random.random_sample((3, 5)),
             torch.ones((3, 4, 5), dtype=torch.int64),
+            torch.tensor([1 + 2j, 3 - 4j]).conj(),
+            torch.tensor([1 + 2j, 3 - 4j]).conj().imag,
             make_iter_result(),
             RunResults(
                 [("runner0", [make_iter_result()]), ("runner0", [make_iter_result()])]
@@ -176,6 +318,7 @@ class TestImplementations:
         ],
         ids=lambda x: type(x),
     )
+    @pytest.mark.usefixtures("json_backend")
     def test_serde(self, obj):
         encoded = to_json(obj)
         decoded = from_json(encoded)
@@ -186,6 +329,38 @@ class TestImplementations:
         else:
             assert decoded == obj
 
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            np.arange(100, dtype=np.float64),
+            np.ones((3, 4, 5), dtype=np.complex128),
+        ],
+        ids=lambda x: x.dtype,
+    )
+    def test_decoded_array_aligned(self, obj):
+        decoded = from_json(to_json(obj))
+        assert decoded.flags.aligned
+        assert decoded.ctypes.data % decoded.dtype.alignment == 0
+        assert np.array_equal(decoded, obj)
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            np.zeros((64, 64), dtype=np.float32),
+            torch.zeros((64, 64), dtype=torch.float32),
+        ],
+        ids=lambda x: type(x),
+    )
+    def test_serde_compressed(self, obj, monkeypatch):
+        monkeypatch.setattr(config, "JSON_COMPRESS", True)
+        encoded = to_json(obj)
+        assert '"codec": "zlib"' in encoded
+        decoded = from_json(encoded)
+        if isinstance(obj, np.ndarray):
+            assert np.array_equal(decoded, obj)
+        else:
+            assert torch.equal(decoded, obj)
+
     @pytest.mark.parametrize("obj", JSONABLE_CASES)
     def test_to_from_json(self, obj):
         encoded = obj.to_json()
@@ -193,12 +368,142 @@ class TestImplementations:
         assert decoded == obj
 
     @pytest.mark.parametrize("obj", JSONABLE_CASES)
-    def test_save_load(self, obj):
-        with util.NamedTemporaryFile("w+") as f:
+    def test_to_json_bytes(self, obj):
+        assert to_json_bytes(obj) == to_json(obj).encode()
+
+    @pytest.mark.parametrize("mode", ["w+", "wb+"])
+    @pytest.mark.parametrize("obj", JSONABLE_CASES)
+    def test_save_load(self, obj, mode):
+        with util.NamedTemporaryFile(mode) as f:
             obj.save(f)
             decoded = type(obj).load(f)
             assert decoded == obj
 
+    @pytest.mark.parametrize("mode", ["w+", "wb+"])
+    def test_save_load_non_ascii(self, mode):
+        obj = {"n\u00e9v": "\u00e9"}
+        with util.NamedTemporaryFile(mode) as f:
+            save_json(obj, f)
+            assert load_json(f) == obj
+            assert load_json(f.name) == obj
+
+    def test_save_load_side_binary(self):
+        obj = {
+            "large_array": np.random.random_sample((256, 256)).astype(np.float32),
+            "large_tensor": torch.ones((256, 256), dtype=torch.float16),
+            "small_array": np.ones((2, 2), dtype=np.float32),
+        }
+        with tempfile.TemporaryDirectory() as outdir:
+            path = os.path.join(outdir, "obj.json")
+            save_json(obj, path, side_binary=True)
+            assert os.path.exists(path + ".bin")
+
+            decoded = load_json(path)
+            assert np.array_equal(decoded["large_array"], obj["large_array"])
+            assert torch.equal(decoded["large_tensor"], obj["large_tensor"])
+            assert np.array_equal(decoded["small_array"], obj["small_array"])
+
+            # Modifying the decoded array should not modify the file.
+            decoded["large_array"][0, 0] = -1
+            assert np.array_equal(load_json(path)["large_array"], obj["large_array"])
+
+            with pytest.raises(
+                PolygraphyException, match="Could not locate side binary file"
+            ):
+                from_json(util.load_file(path, mode="r"))
+
+    @pytest.mark.parametrize("ext", ["../obj.json.bin", "/tmp/obj.json.bin", "..", ""])
+    def test_load_side_binary_rejects_paths(self, ext):
+        obj = {"large_array": np.ones((256, 256), dtype=np.float32)}
+        with tempfile.TemporaryDirectory() as outdir:
+            path = os.path.join(outdir, "obj.json")
+            save_json(obj, path, side_binary=True)
+
+            contents = util.load_file(path, mode="r")
+            util.save_file(
+                contents.replace('"obj.json.bin"', json.dumps(ext)), path, mode="w"
+            )
+            with pytest.raises(
+                PolygraphyException, match="Invalid side binary file name"
+            ):
+                load_json(path)
+
+    def test_save_side_binary_not_created_if_unused(self):
+        obj = {"small_array": np.ones((2, 2), dtype=np.float32)}
+        with tempfile.TemporaryDirectory() as outdir:
+            path = os.path.join(outdir, "obj.json")
+            save_json(obj, path, side_binary=True)
+            assert not os.path.exists(path + ".bin")
+            assert np.array_equal(load_json(path)["small_array"], obj["small_array"])
+
+    def test_save_side_binary_with_stdlib_fallback(self):
+        # Non-finite floats force a fallback to the standard library when orjson is installed.
+        # The array must still only be written to the side binary file once.
+        obj = {
+            "inf": float("inf"),
+            "large_array": np.ones((256, 256), dtype=np.float32),
+        }
+        with tempfile.TemporaryDirectory() as outdir:
+            path = os.path.join(outdir, "obj.json")
+            save_json(obj, path, side_binary=True)
+            assert os.path.getsize(path + ".bin") == obj["large_array"].nbytes
+
+            decoded = load_json(path)
+            assert decoded["inf"] == float("inf")
+            assert np.array_equal(decoded["large_array"], obj["large_array"])
+
+    def test_save_side_binary_to_loaded_path(self):
+        obj = {"large_array": np.random.random_sample((256, 256)).astype(np.float32)}
+        with tempfile.TemporaryDirectory() as outdir:
+            path = os.path.join(outdir, "obj.json")
+            save_json(obj, path, side_binary=True)
+
+            # Overwriting the side binary file must not affect data that was loaded from it.
+            decoded = load_json(path)
+            save_json(decoded, path, side_binary=True)
+            assert np.array_equal(decoded["large_array"], obj["large_array"])
+            assert np.array_equal(load_json(path)["large_array"], obj["large_array"])
+
+    @pytest.mark.parametrize("dtype", ["torch.nonexistent", "torch.ones"])
+    def test_tensor_invalid_dtype(self, dtype):
+        encoded = json.loads(to_json(torch.ones((2, 2), dtype=torch.float32)))
+        encoded["dtype"] = dtype
+        with pytest.raises(PolygraphyException, match="unrecognized data type"):
+            from_json(json.dumps(encoded))
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            np.ma.masked_array([1.0, 2.0, 3.0], mask=[0, 1, 0]),
+            np.rec.array([(1, 2.0)], dtype=[("x", np.int32), ("y", np.float32)]),
+        ],
+        ids=lambda x: type(x),
+    )
+    def test_array_subclass_not_serializable(self, obj):
+        with pytest.raises(
+            PolygraphyException, match="Cannot encode instances of NumPy array subclass"
+        ):
+            to_json(obj)
+
+    @pytest.mark.parametrize(
+        "obj",
+        [
+            np.array([np.nan, 1.0], dtype=np.float32),
+            np.array([np.inf, -np.inf], dtype=np.float64),
+        ],
+    )
+    def test_small_array_non_finite(self, obj):
+        encoded = to_json(obj)
+        # Non-finite values are not valid JSON, so should not be written as literals.
+        assert "NaN" not in encoded and "Infinity" not in encoded
+        assert np.array_equal(from_json(encoded), obj, equal_nan=True)
+
+    def test_object_array_not_serializable(self):
+        with pytest.raises(
+            PolygraphyException, match="Cannot encode arrays containing Python objects"
+        ):
+            to_json(np.array([object()]))
+
     def test_cannot_save_load_to_different_types(self):
         run_result = JSONABLE_CASES[0]
         encoded = run_result.to_json()